@@ -104,7 +104,7 @@ logger.info(f"已注册 {len(registered_tools)} 个工具: {', '.join(registered
 # --- 3. 会话管理 (使用 SessionManager) ---
 
 # 初始化会话管理器（不册管理system_prompt，由Agent动态注入）
-session_manager = SessionManager()
+session_manager = SessionManager(max_history=config.app.max_history_messages)
 logger.info("会话管理器已初始化")
 
 # --- 4. Agent 系统初始化 (多Agent架构) ---
@@ -276,6 +276,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
 
             if message_data["type"] == "message":
                 user_input = message_data["content"]
+                session_manager.trim_messages(session_id)
                 messages = session_manager.get_messages(session_id)
 
                 # 获取处理模式（默认使用 Agent）
@@ -261,7 +261,8 @@ class CodeUnderstandingAgent(BaseAgent):
         
         # 收集响应数据
         tool_calls_dict = {}
-        content_buffer = ""
+        tool_args_parts = {}
+        content_parts = []
         
         # 处理流式响应
         async for chunk in response:
@@ -282,20 +283,26 @@ class CodeUnderstandingAgent(BaseAgent):
                             "function": {"name": "", "arguments": ""}
                         }
                     
-                    if tool_call.function:
-                        if tool_call.function.name:
-                            tool_calls_dict[index]["function"]["name"] = tool_call.function.name
-                        if tool_call.function.arguments:
-                            tool_calls_dict[index]["function"]["arguments"] += tool_call.function.arguments
+                    function = tool_call.function
+                    if function:
+                        if function.name:
+                            tool_calls_dict[index]["function"]["name"] = function.name
+                        if function.arguments:
+                            tool_args_parts.setdefault(index, []).append(function.arguments)
             
             # 处理内容流
-            if delta.content:
-                content_buffer += delta.content
+            content = delta.content
+            if content:
+                content_parts.append(content)
                 await websocket.send_json({
                     "type": "assistant_chunk",
                     "messageId": message_id,
-                    "content": delta.content
+                    "content": content
                 })
+
+        content_buffer = "".join(content_parts)
+        for index, parts in tool_args_parts.items():
+            tool_calls_dict[index]["function"]["arguments"] = "".join(parts)
         
         # 处理迭代结果
         tool_calls = list(tool_calls_dict.values()) if tool_calls_dict else None
@@ -392,10 +399,11 @@ class CodeUnderstandingAgent(BaseAgent):
     def get_info(self) -> Dict[str, Any]:
         """获取 Agent 信息"""
         base_info = super().get_info()
+        available_tools = self.get_available_tools()
         base_info.update({
             "max_iterations": self.max_iterations,
-            "available_tools": self.get_available_tools(),
-            "tool_count": len(self.get_available_tools()),
+            "available_tools": available_tools,
+            "tool_count": len(available_tools),
             "specialization": "代码理解与分析",
             "memory_enabled": self.enable_memory
         })
@@ -227,7 +227,8 @@ class FunctionCallAgent(BaseAgent):
 
         # 收集响应数据
         tool_calls_dict = {}
-        content_buffer = ""
+        tool_args_parts = {}
+        content_parts = []
 
         # 处理流式响应
         async for chunk in response:
@@ -252,27 +253,33 @@ class FunctionCallAgent(BaseAgent):
                             "function": {"name": "", "arguments": ""},
                         }
 
-                    if tool_call.function:
-                        if tool_call.function.name:
+                    function = tool_call.function
+                    if function:
+                        if function.name:
                             tool_calls_dict[index]["function"]["name"] = (
-                                tool_call.function.name
+                                function.name
                             )
-                        if tool_call.function.arguments:
-                            tool_calls_dict[index]["function"]["arguments"] += (
-                                tool_call.function.arguments
+                        if function.arguments:
+                            tool_args_parts.setdefault(index, []).append(
+                                function.arguments
                             )
 
             # 处理内容流
-            if delta.content:
-                content_buffer += delta.content
+            content = delta.content
+            if content:
+                content_parts.append(content)
                 await websocket.send_json(
                     {
                         "type": "assistant_chunk",
                         "messageId": message_id,
-                        "content": delta.content,
+                        "content": content,
                     }
                 )
 
+        content_buffer = "".join(content_parts)
+        for index, parts in tool_args_parts.items():
+            tool_calls_dict[index]["function"]["arguments"] = "".join(parts)
+
         # 处理迭代结果
         tool_calls = list(tool_calls_dict.values()) if tool_calls_dict else None
 
@@ -334,17 +341,30 @@ class FunctionCallAgent(BaseAgent):
             }
         )
 
-        # 执行所有工具调用
-        for tool_call in tool_calls:
+        calls = [(tc["function"]["name"], tc["function"]["arguments"]) for tc in tool_calls]
+
+        if all(self.tool_registry.is_read_only(tool_name) for tool_name, _ in calls):
+            # 只读工具互不影响，并发执行
+            if self.session_manager.get_cancel_flag(session_id):
+                return
+            tool_results = await self.tool_registry.execute_tools(calls)
+        else:
+            # 含有副作用的工具按顺序执行（如先写文件再运行），每次调用前检查取消信号
+            tool_results = None
+
+        # 按调用顺序执行/回传结果
+        for index, tool_call in enumerate(tool_calls):
             # 检查取消信号
             if self.session_manager.get_cancel_flag(session_id):
                 return
 
-            tool_name = tool_call["function"]["name"]
-            tool_args = tool_call["function"]["arguments"]
+            tool_name, tool_args = calls[index]
 
             # 执行工具
-            tool_result = await self.tool_registry.execute_tool(tool_name, tool_args)
+            if tool_results is None:
+                tool_result = await self.tool_registry.execute_tool(tool_name, tool_args)
+            else:
+                tool_result = tool_results[index]
 
             logger.debug(f"[{self.name}] 工具调用完成: {tool_name}")
 
@@ -370,11 +390,12 @@ class FunctionCallAgent(BaseAgent):
     def get_info(self) -> Dict[str, Any]:
         """获取 Agent 信息"""
         base_info = super().get_info()
+        available_tools = self.get_available_tools()
         base_info.update(
             {
                 "max_iterations": self.max_iterations,
-                "available_tools": self.get_available_tools(),
-                "tool_count": len(self.get_available_tools()),
+                "available_tools": available_tools,
+                "tool_count": len(available_tools),
             }
         )
         return base_info
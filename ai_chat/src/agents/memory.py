@@ -109,6 +109,8 @@ class MemoryManager:
             max_long_term: 长期记忆最大数量
         """
         self.memories: Dict[str, Memory] = {}
+        # 按类型索引：{记忆类型: {记忆ID: Memory}}，避免按类型查询时扫描全部记忆
+        self._by_type: Dict[MemoryType, Dict[str, Memory]] = {t: {} for t in MemoryType}
         self.max_short_term = max_short_term
         self.max_long_term = max_long_term
         
@@ -149,7 +151,7 @@ class MemoryManager:
             metadata=metadata or {}
         )
         
-        self.memories[memory_id] = memory
+        self._store(memory)
         logger.debug(f"添加记忆: {memory_id} [{memory_type.value}] {content[:50]}...")
         
         # 自动清理超出限制的记忆
@@ -157,13 +159,34 @@ class MemoryManager:
         
         return memory
     
+    def _store(self, memory: Memory) -> None:
+        """保存记忆并更新类型索引"""
+        existing = self.memories.get(memory.id)
+        self.memories[memory.id] = memory
+        if existing is not None and existing.memory_type != memory.memory_type:
+            # 覆盖的记忆类型发生变化时重建索引，保持与memories一致的顺序
+            self._rebuild_type_index()
+        else:
+            self._by_type.setdefault(memory.memory_type, {})[memory.id] = memory
+    
+    def _remove(self, memory_id: str) -> None:
+        """删除记忆并更新类型索引"""
+        memory = self.memories.pop(memory_id)
+        self._by_type.get(memory.memory_type, {}).pop(memory_id, None)
+    
+    def _rebuild_type_index(self) -> None:
+        """根据memories重建类型索引"""
+        self._by_type = {t: {} for t in MemoryType}
+        for memory in self.memories.values():
+            self._by_type.setdefault(memory.memory_type, {})[memory.id] = memory
+    
     def get_memory(self, memory_id: str) -> Optional[Memory]:
         """获取指定ID的记忆"""
         return self.memories.get(memory_id)
     
     def get_memories_by_type(self, memory_type: MemoryType) -> List[Memory]:
         """获取指定类型的所有记忆"""
-        return [m for m in self.memories.values() if m.memory_type == memory_type]
+        return list(self._by_type.get(memory_type, {}).values())
     
     def get_memories_by_tags(self, tags: List[str]) -> List[Memory]:
         """获取包含指定标签的记忆"""
@@ -184,11 +207,11 @@ class MemoryManager:
         Returns:
             按时间倒序排列的记忆列表
         """
-        memories = list(self.memories.values())
-        
-        # 按类型过滤
         if memory_type:
-            memories = [m for m in memories if m.memory_type == memory_type]
+            # 按类型过滤
+            memories = self.get_memories_by_type(memory_type)
+        else:
+            memories = list(self.memories.values())
         
         # 按时间戳排序
         memories.sort(key=lambda m: m.timestamp, reverse=True)
@@ -251,12 +274,15 @@ class MemoryManager:
                 setattr(memory, key, value)
                 logger.debug(f"更新记忆 {memory_id}: {key}={value}")
         
+        if "memory_type" in kwargs:
+            self._rebuild_type_index()
+        
         return True
     
     def delete_memory(self, memory_id: str) -> bool:
         """删除指定记忆"""
         if memory_id in self.memories:
-            del self.memories[memory_id]
+            self._remove(memory_id)
             logger.debug(f"删除记忆: {memory_id}")
             return True
         return False
@@ -264,13 +290,14 @@ class MemoryManager:
     def clear_memories(self, memory_type: MemoryType = None) -> None:
         """清空记忆（可按类型清空）"""
         if memory_type:
-            to_delete = [m.id for m in self.memories.values() if m.memory_type == memory_type]
+            to_delete = list(self._by_type.get(memory_type, {}))
             for memory_id in to_delete:
-                del self.memories[memory_id]
+                self._remove(memory_id)
             logger.info(f"清空{memory_type.value}类型记忆: {len(to_delete)}条")
         else:
             count = len(self.memories)
             self.memories.clear()
+            self._rebuild_type_index()
             logger.info(f"清空所有记忆: {count}条")
     
     def _cleanup_old_memories(self) -> None:
@@ -282,7 +309,7 @@ class MemoryManager:
             short_term.sort(key=lambda m: m.timestamp)
             to_delete = short_term[:len(short_term) - self.max_short_term]
             for memory in to_delete:
-                del self.memories[memory.id]
+                self._remove(memory.id)
             logger.debug(f"清理{len(to_delete)}条旧的短期记忆")
         
         # 清理长期记忆（保留重要的）
@@ -298,7 +325,7 @@ class MemoryManager:
             long_term.sort(key=lambda m: (importance_order[m.importance], m.timestamp))
             to_delete = long_term[:len(long_term) - self.max_long_term]
             for memory in to_delete:
-                del self.memories[memory.id]
+                self._remove(memory.id)
             logger.debug(f"清理{len(to_delete)}条旧的长期记忆")
     
     def generate_memory_context(
@@ -441,7 +468,7 @@ class MemoryManager:
             
             for mem_dict in data.get("memories", []):
                 memory = Memory.from_dict(mem_dict)
-                self.memories[memory.id] = memory
+                self._store(memory)
                 count += 1
             
             logger.info(f"成功导入{count}条记忆")
@@ -416,7 +416,8 @@ class PlanningAgent(BaseAgent):
         
         # 处理流式响应（支持工具调用）
         tool_calls_dict = {}
-        content_buffer = ""
+        tool_args_parts = {}
+        content_parts = []
         max_tool_iterations = 5  # 最多允许5次工具调用
         iteration = 0
         
@@ -438,15 +439,21 @@ class PlanningAgent(BaseAgent):
                                 "function": {"name": "", "arguments": ""}
                             }
                         
-                        if tool_call.function:
-                            if tool_call.function.name:
-                                tool_calls_dict[index]["function"]["name"] = tool_call.function.name
-                            if tool_call.function.arguments:
-                                tool_calls_dict[index]["function"]["arguments"] += tool_call.function.arguments
+                        function = tool_call.function
+                        if function:
+                            if function.name:
+                                tool_calls_dict[index]["function"]["name"] = function.name
+                            if function.arguments:
+                                tool_args_parts.setdefault(index, []).append(function.arguments)
                 
                 # 收集内容
-                if delta.content:
-                    content_buffer += delta.content
+                content = delta.content
+                if content:
+                    content_parts.append(content)
+            
+            content_buffer = "".join(content_parts)
+            for index, parts in tool_args_parts.items():
+                tool_calls_dict[index]["function"]["arguments"] = "".join(parts)
             
             # 检查是否有工具调用
             tool_calls = list(tool_calls_dict.values()) if tool_calls_dict else None
@@ -494,6 +501,8 @@ class PlanningAgent(BaseAgent):
                 # 继续对话，让LLM基于工具结果继续分析
                 iteration += 1
                 tool_calls_dict = {}
+                tool_args_parts = {}
+                content_parts = []
                 content_buffer = ""
                 
                 request_params["messages"] = analysis_messages
@@ -612,14 +621,17 @@ class PlanningAgent(BaseAgent):
         
         response = await self.llm_client.client.chat.completions.create(**request_params)
         
-        content_buffer = ""
+        content_parts = []
         async for chunk in response:
             if self.session_manager.get_cancel_flag(session_id):
                 return []
             
             delta = chunk.choices[0].delta
-            if delta.content:
-                content_buffer += delta.content
+            content = delta.content
+            if content:
+                content_parts.append(content)
+
+        content_buffer = "".join(content_parts)
         
         messages.append({"role": "assistant", "content": content_buffer})
         
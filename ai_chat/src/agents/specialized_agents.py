@@ -74,19 +74,22 @@ class SimpleAgent(BaseAgent):
             })
             
             # 流式输出
-            content_buffer = ""
+            content_parts = []
             async for chunk in response:
                 if self.session_manager.get_cancel_flag(session_id):
                     break
                 
                 delta = chunk.choices[0].delta
-                if delta.content:
-                    content_buffer += delta.content
+                content = delta.content
+                if content:
+                    content_parts.append(content)
                     await websocket.send_json({
                         "type": "assistant_chunk",
                         "messageId": message_id,
-                        "content": delta.content
+                        "content": content
                     })
+
+            content_buffer = "".join(content_parts)
             
             # 保存消息
             messages.append({"role": "assistant", "content": content_buffer})
@@ -183,19 +186,22 @@ class AnalysisAgent(BaseAgent):
                 "messageId": message_id
             })
             
-            content_buffer = ""
+            content_parts = []
             async for chunk in response:
                 if self.session_manager.get_cancel_flag(session_id):
                     break
                 
                 delta = chunk.choices[0].delta
-                if delta.content:
-                    content_buffer += delta.content
+                content = delta.content
+                if content:
+                    content_parts.append(content)
                     await websocket.send_json({
                         "type": "assistant_chunk",
                         "messageId": message_id,
-                        "content": delta.content
+                        "content": content
                     })
+
+            content_buffer = "".join(content_parts)
             
             messages.append({"role": "assistant", "content": content_buffer})
             
@@ -305,7 +311,8 @@ class CodeAgent(BaseAgent):
                 })
                 
                 tool_calls_dict = {}
-                content_buffer = ""
+                tool_args_parts = {}
+                content_parts = []
                 
                 async for chunk in response:
                     if self.session_manager.get_cancel_flag(session_id):
@@ -323,19 +330,25 @@ class CodeAgent(BaseAgent):
                                     "function": {"name": "", "arguments": ""}
                                 }
                             
-                            if tool_call.function:
-                                if tool_call.function.name:
-                                    tool_calls_dict[index]["function"]["name"] = tool_call.function.name
-                                if tool_call.function.arguments:
-                                    tool_calls_dict[index]["function"]["arguments"] += tool_call.function.arguments
+                            function = tool_call.function
+                            if function:
+                                if function.name:
+                                    tool_calls_dict[index]["function"]["name"] = function.name
+                                if function.arguments:
+                                    tool_args_parts.setdefault(index, []).append(function.arguments)
                     
-                    if delta.content:
-                        content_buffer += delta.content
+                    content = delta.content
+                    if content:
+                        content_parts.append(content)
                         await websocket.send_json({
                             "type": "assistant_chunk",
                             "messageId": message_id,
-                            "content": delta.content
+                            "content": content
                         })
+
+                content_buffer = "".join(content_parts)
+                for index, parts in tool_args_parts.items():
+                    tool_calls_dict[index]["function"]["arguments"] = "".join(parts)
                 
                 tool_calls = list(tool_calls_dict.values()) if tool_calls_dict else None
                 
@@ -175,7 +175,8 @@ class FunctionCallProcessor:
         
         # 收集响应数据
         tool_calls_dict = {}
-        content_buffer = ""
+        tool_args_parts = {}
+        content_parts = []
         
         async for chunk in response:
             # 检查取消信号
@@ -195,20 +196,26 @@ class FunctionCallProcessor:
                             "function": {"name": "", "arguments": ""}
                         }
                     
-                    if tool_call.function:
-                        if tool_call.function.name:
-                            tool_calls_dict[index]["function"]["name"] = tool_call.function.name
-                        if tool_call.function.arguments:
-                            tool_calls_dict[index]["function"]["arguments"] += tool_call.function.arguments
+                    function = tool_call.function
+                    if function:
+                        if function.name:
+                            tool_calls_dict[index]["function"]["name"] = function.name
+                        if function.arguments:
+                            tool_args_parts.setdefault(index, []).append(function.arguments)
             
             # 处理内容流
-            if delta.content:
-                content_buffer += delta.content
+            content = delta.content
+            if content:
+                content_parts.append(content)
                 await websocket.send_json({
                     "type": "assistant_chunk",
                     "messageId": message_id,
-                    "content": delta.content
+                    "content": content
                 })
+
+        content_buffer = "".join(content_parts)
+        for index, parts in tool_args_parts.items():
+            tool_calls_dict[index]["function"]["arguments"] = "".join(parts)
         
         # 处理本次迭代的结果
         tool_calls = list(tool_calls_dict.values()) if tool_calls_dict else None
@@ -140,7 +140,8 @@ class MessageProcessor:
         
         # 收集工具调用和内容
         tool_calls_dict = {}
-        content_buffer = ""
+        tool_args_parts = {}
+        content_parts = []
         
         async for chunk in response:
             # 检查是否收到停止信号
@@ -164,20 +165,26 @@ class MessageProcessor:
                             "function": {"name": "", "arguments": ""}
                         }
                     
-                    if tool_call.function:
-                        if tool_call.function.name:
-                            tool_calls_dict[index]["function"]["name"] = tool_call.function.name
-                        if tool_call.function.arguments:
-                            tool_calls_dict[index]["function"]["arguments"] += tool_call.function.arguments
+                    function = tool_call.function
+                    if function:
+                        if function.name:
+                            tool_calls_dict[index]["function"]["name"] = function.name
+                        if function.arguments:
+                            tool_args_parts.setdefault(index, []).append(function.arguments)
             
             # 内容流处理
-            if delta.content:
-                content_buffer += delta.content
+            content = delta.content
+            if content:
+                content_parts.append(content)
                 await websocket.send_json({
                     "type": "assistant_chunk",
                     "messageId": message_id,
-                    "content": delta.content
+                    "content": content
                 })
+
+        content_buffer = "".join(content_parts)
+        for index, parts in tool_args_parts.items():
+            tool_calls_dict[index]["function"]["arguments"] = "".join(parts)
         
         # 保存助手消息
         tool_calls = list(tool_calls_dict.values()) if tool_calls_dict else None
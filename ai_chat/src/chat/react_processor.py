@@ -9,6 +9,9 @@ from fastapi import WebSocket
 
 from ..tools.registry import ToolRegistry
 from .session import SessionManager
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class ReactAgentProcessor:
@@ -106,7 +109,7 @@ class ReactAgentProcessor:
             })
             return
         except Exception as e:
-            print(f"Error in React processing: {e}")
+            logger.error(f"React 处理错误 (session: {session_id}): {e}", exc_info=True)
             await websocket.send_json({
                 "type": "error",
                 "message": f"处理消息时出错: {str(e)}"
@@ -166,10 +169,7 @@ class ReactAgentProcessor:
             react_prompt = await self._build_react_prompt(user_input, history)
             
             # 添加调试日志
-            print(f"\n[DEBUG] Step {current_step} Prompt:")
-            print(f"{'='*50}")
-            print(react_prompt)
-            print(f"{'='*50}\n")
+            logger.debug(f"Step {current_step} Prompt:\n{react_prompt}")
             
             # 2. 流式调用 LLM 获取 Thought 和 Action
             thought, action = await self._stream_react_response(
@@ -186,7 +186,7 @@ class ReactAgentProcessor:
                 break
             
             # 3. 检查是否完成
-            print(f"[DEBUG] 检查 Finish: action={action}, startswith('Finish')={action.startswith('Finish') if action else False}")
+            logger.debug(f"检查 Finish: action={action}")
             
             # 支持多种 Finish 格式
             is_finish = False
@@ -201,7 +201,7 @@ class ReactAgentProcessor:
             
             if is_finish:
                 final_answer = self._parse_action_input(action)
-                print(f"[DEBUG] 检测到 Finish，最终答案: {final_answer}")
+                logger.debug(f"检测到 Finish，最终答案: {final_answer}")
                 
                 # 发送最终答案
                 await websocket.send_json({
@@ -225,8 +225,7 @@ class ReactAgentProcessor:
             tool_name, tool_input = self._parse_action(action)
             
             # 添加调试日志
-            print(f"[DEBUG] Action 原文: {action}")
-            print(f"[DEBUG] 解析结果 - tool_name: {tool_name}, tool_input: {tool_input}")
+            logger.debug(f"Action 原文: {action}, 解析结果 - tool_name: {tool_name}, tool_input: {tool_input}")
             
             if not tool_name:
                 observation = f"错误：无效的 Action 格式\n原文: {action}\n解析: tool_name={tool_name}, tool_input={tool_input}"
@@ -359,7 +358,7 @@ class ReactAgentProcessor:
         )
         
         # 收集响应内容
-        content_buffer = ""
+        content_parts = []
         
         async for chunk in response:
             # 检查取消标记
@@ -368,28 +367,28 @@ class ReactAgentProcessor:
             
             delta = chunk.choices[0].delta
             
-            if delta.content:
-                content_buffer += delta.content
+            content = delta.content
+            if content:
+                content_parts.append(content)
                 
                 # 流式发送内容
                 await websocket.send_json({
                     "type": "react_chunk",
                     "messageId": message_id,
                     "step": step,
-                    "content": delta.content
+                    "content": content
                 })
+
+        content_buffer = "".join(content_parts)
         
         # 解析 Thought 和 Action
         thought, action = self._parse_react_output(content_buffer)
         
         # 添加调试：输出完整的 LLM 响应
-        print(f"\n[DEBUG] Step {step} LLM 完整响应:")
-        print(f"{'='*50}")
-        print(content_buffer)
-        print(f"{'='*50}")
-        print(f"[DEBUG] 解析结果 - Thought: {thought}")
-        print(f"[DEBUG] 解析结果 - Action: {action}")
-        print()
+        logger.debug(
+            f"Step {step} LLM 完整响应:\n{content_buffer}\n"
+            f"解析结果 - Thought: {thought}, Action: {action}"
+        )
         
         # 发送解析结果
         if thought:
@@ -463,18 +462,17 @@ class ReactAgentProcessor:
             cleaned_action = cleaned_action[:-1]
         cleaned_action = cleaned_action.strip()
         
-        print(f"[DEBUG] _parse_action - 原文: {action_text}")
-        print(f"[DEBUG] _parse_action - 清理后: {cleaned_action}")
+        logger.debug(f"_parse_action - 原文: {action_text}, 清理后: {cleaned_action}")
         
         # 匹配格式：工具名[参数]（支持多行）
         match = re.match(r"(\w+)\[(.*)\]$", cleaned_action, re.DOTALL)
         if match:
             tool_name = match.group(1)
             tool_input = match.group(2).strip()
-            print(f"[DEBUG] _parse_action - 匹配成功: tool_name={tool_name}, tool_input={tool_input}")
+            logger.debug(f"_parse_action - 匹配成功: tool_name={tool_name}, tool_input={tool_input}")
             return tool_name, tool_input
         
-        print(f"[DEBUG] _parse_action - 匹配失败")
+        logger.debug("_parse_action - 匹配失败")
         return None, None
     
     def _parse_action_input(self, action_text: str) -> str:
@@ -1,6 +1,6 @@
 """Session management for chat conversations."""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import asyncio
 from ..utils.logger import get_logger
 
@@ -10,13 +10,19 @@ logger = get_logger(__name__)
 class SessionManager:
     """Manages chat sessions, message history, and task control."""
     
-    def __init__(self):
+    def __init__(self, max_history: Optional[int] = None):
         """
         Initialize session manager.
         
+        Args:
+            max_history: Maximum number of non-system messages kept per
+                session (None or 0 means unlimited)
+        
         Note: SessionManager 不册管理 system_prompt，
         由各个Agent在运行时动态注入自己的 system_prompt
         """
+        self.max_history = max_history
+        
         # 会话消息历史
         self._sessions: Dict[str, List[Dict[str, Any]]] = {}
         
@@ -51,6 +57,38 @@ class SessionManager:
         messages = self.get_messages(session_id)
         messages.append(message)
     
+    def trim_messages(self, session_id: str) -> None:
+        """
+        Trim session history to the configured window, in place.
+        
+        The leading system message is kept, and the cut always lands on a
+        user message so that assistant tool calls and their tool results
+        are dropped together.
+        
+        Args:
+            session_id: Session identifier
+        """
+        if not self.max_history:
+            return
+        messages = self._sessions.get(session_id)
+        if not messages:
+            return
+        
+        start = 1 if messages[0].get("role") == "system" else 0
+        excess = len(messages) - start - self.max_history
+        if excess <= 0:
+            return
+        
+        # 从超出位置向后找到下一条用户消息作为新的起点
+        cut = start + excess
+        while cut < len(messages) and messages[cut].get("role") != "user":
+            cut += 1
+        if cut >= len(messages):
+            return
+        
+        del messages[start:cut]
+        logger.debug(f"会话 {session_id} 历史已裁剪 {cut - start} 条消息")
+    
     def set_task(self, session_id: str, task: asyncio.Task) -> None:
         """
         Set the current task for a session.
@@ -138,6 +138,10 @@ class AppConfig(BaseModel):
         ),
         description="System prompt for AI assistant"
     )
+    max_history_messages: int = Field(
+        default=40,
+        description="Maximum non-system messages kept per session (0 for unlimited)"
+    )
 
 
 class Config(BaseModel):
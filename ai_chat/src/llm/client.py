@@ -1,5 +1,6 @@
 """LLM client management."""
 
+import asyncio
 import httpx
 from openai import AsyncOpenAI
 from typing import Optional
@@ -10,6 +11,14 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class LLMClient:
     """Manages LLM client lifecycle and provides access to OpenAI client."""
     
@@ -23,6 +32,8 @@ class LLMClient:
         self.config = config
         self._http_client: Optional[httpx.AsyncClient] = None
         self._openai_client: Optional[AsyncOpenAI] = None
+        # 首次使用客户端时所在的事件循环，连接池不能跨事件循环使用
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def initialize(self) -> AsyncOpenAI:
         """
@@ -34,7 +45,15 @@ class LLMClient:
         if self._openai_client is None:
             logger.info(f"初始化 OpenAI 客户端: {self.config.base_url}")
             # 创建自定义 HTTP 客户端用于连接复用
-            self._http_client = httpx.AsyncClient()
+            # 空闲连接保持 30 秒（默认 5 秒），Agent 在两次 LLM 调用之间执行工具时
+            # 连接不会过期，避免重新建立 TCP/TLS 连接
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0
+                )
+            )
             
             # 创建 OpenAI 客户端
             self._openai_client = AsyncOpenAI(
@@ -43,6 +62,7 @@ class LLMClient:
                 http_client=self._http_client
             )
             logger.info(f"使用模型: {self.config.model}")
+            self._client_loop = _running_loop()
         
         return self._openai_client
     
@@ -51,9 +71,21 @@ class LLMClient:
         """
         Get OpenAI client, initialize if needed.
         
+        The client is bound to the event loop it is first used on and is
+        recreated when used from a different loop (e.g. a later asyncio.run).
+        
         Returns:
             AsyncOpenAI client
         """
+        loop = _running_loop()
+        if self._openai_client is not None and loop is not None:
+            if self._client_loop is None:
+                self._client_loop = loop
+            elif self._client_loop is not loop:
+                # 旧事件循环上的连接无法在当前循环中关闭，直接丢弃
+                logger.debug("事件循环已变化，重新创建 HTTP 客户端")
+                self._http_client = None
+                self._openai_client = None
         if self._openai_client is None:
             return self.initialize()
         return self._openai_client
@@ -72,9 +104,11 @@ class LLMClient:
         """Close HTTP client and release resources."""
         if self._http_client is not None:
             logger.info("关闭 HTTP 客户端")
-            await self._http_client.aclose()
+            if self._client_loop in (None, asyncio.get_running_loop()):
+                await self._http_client.aclose()
             self._http_client = None
             self._openai_client = None
+            self._client_loop = None
             logger.debug("HTTP 客户端已释放")
     
     def __del__(self):
@@ -7,6 +7,9 @@ from typing import Dict, Any
 class BaseTool(ABC):
     """Abstract base class for all tools."""
     
+    # 只读工具没有副作用，同一轮中的只读工具调用可以并发执行
+    read_only: bool = False
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -1,12 +1,95 @@
 """Calculator tool for mathematical operations."""
 
-from typing import Dict, Any
+import ast
+import operator
+from functools import lru_cache
+from typing import Dict, Any, Union
 from .base import BaseTool
 
 
+# 幂运算上限：指数绝对值与整数结果的位数，防止 9**9**9 这类表达式长时间阻塞事件循环
+_MAX_EXPONENT = 1000
+_MAX_POWER_BITS = 10000
+
+
+def _bounded_pow(base: Union[int, float], exponent: Union[int, float]) -> Union[int, float]:
+    """
+    Raise base to exponent, rejecting results that are too expensive to compute.
+    
+    Args:
+        base: Base value
+        exponent: Exponent value
+        
+    Returns:
+        Numeric result
+        
+    Raises:
+        ValueError: If the exponent or the resulting integer is too large
+    """
+    if abs(exponent) > _MAX_EXPONENT:
+        raise ValueError(f"指数过大（绝对值不能超过 {_MAX_EXPONENT}）")
+    if (isinstance(base, int) and isinstance(exponent, int) and exponent > 0
+            and base.bit_length() * exponent > _MAX_POWER_BITS):
+        raise ValueError("幂运算结果过大")
+    return operator.pow(base, exponent)
+
+
+# 支持的运算符
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: _bounded_pow,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_node(node: ast.AST) -> Union[int, float]:
+    """
+    Evaluate an arithmetic AST node.
+    
+    Args:
+        node: Parsed expression node
+        
+    Returns:
+        Numeric result
+        
+    Raises:
+        SyntaxError: If the node is not a supported arithmetic construct
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_eval_node(node.operand))
+    raise SyntaxError(f"unsupported expression: {type(node).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def _evaluate(expression: str) -> Union[int, float]:
+    """
+    Parse and evaluate an arithmetic expression, memoized by expression string.
+    
+    Args:
+        expression: Mathematical expression string
+        
+    Returns:
+        Numeric result
+    """
+    return _eval_node(ast.parse(expression.strip(), mode="eval").body)
+
+
 class CalculatorTool(BaseTool):
     """Tool for performing mathematical calculations."""
     
+    read_only = True
+    
     @property
     def name(self) -> str:
         return "calculator"
@@ -46,8 +129,8 @@ class CalculatorTool(BaseTool):
             if not all(c in allowed_chars for c in expression):
                 return "错误：表达式包含不允许的字符。只支持数字和运算符 (+, -, *, /, **, ())"
             
-            # 使用 eval 计算（在受控环境中）
-            result = eval(expression, {"__builtins__": {}}, {})
+            # 解析为语法树后求值，只支持算术运算
+            result = _evaluate(expression)
             
             # 格式化结果
             if isinstance(result, float):
@@ -10,6 +10,8 @@ from .base import BaseTool
 class AnalyzeProjectStructureTool(BaseTool):
     """Tool for analyzing project structure and generating a tree view."""
     
+    read_only = True
+    
     def __init__(self, base_dir: str = ".", max_depth: int = 4, ignore_patterns: List[str] = None):
         """
         Initialize project structure analysis tool.
@@ -128,6 +130,8 @@ class AnalyzeProjectStructureTool(BaseTool):
 class SearchCodeTool(BaseTool):
     """Tool for searching code content in files."""
     
+    read_only = True
+    
     def __init__(self, base_dir: str = ".", file_extensions: List[str] = None):
         """
         Initialize code search tool.
@@ -277,6 +281,8 @@ class SearchCodeTool(BaseTool):
 class FindFilesTool(BaseTool):
     """Tool for finding files by name pattern."""
     
+    read_only = True
+    
     def __init__(self, base_dir: str = "."):
         """
         Initialize find files tool.
@@ -388,6 +394,8 @@ class FindFilesTool(BaseTool):
 class AnalyzeFileTool(BaseTool):
     """Tool for analyzing a code file's structure (imports, classes, functions, etc.)."""
     
+    read_only = True
+    
     def __init__(self, base_dir: str = "."):
         """
         Initialize file analysis tool.
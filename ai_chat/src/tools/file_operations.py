@@ -10,6 +10,8 @@ from .base import BaseTool
 class ReadFileTool(BaseTool):
     """Tool for reading file contents."""
     
+    read_only = True
+    
     def __init__(self, base_dir: str = ".", max_size: int = 1024 * 1024):  # 1MB default
         """
         Initialize read file tool.
@@ -164,6 +166,8 @@ class WriteFileTool(BaseTool):
 class ListDirectoryTool(BaseTool):
     """Tool for listing directory contents."""
     
+    read_only = True
+    
     def __init__(self, base_dir: str = "."):
         """
         Initialize list directory tool.
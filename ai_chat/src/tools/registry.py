@@ -1,7 +1,8 @@
 """Tool registry for managing and executing tools."""
 
+import asyncio
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from .base import BaseTool
 from ..utils.logger import get_logger
 
@@ -14,6 +15,8 @@ class ToolRegistry:
     def __init__(self):
         """Initialize tool registry."""
         self._tools: Dict[str, BaseTool] = {}
+        # OpenAI 格式工具定义缓存，注册/注销时失效
+        self._cached_openai_tools: Optional[List[Dict[str, Any]]] = None
     
     def register(self, tool: BaseTool) -> None:
         """
@@ -23,6 +26,7 @@ class ToolRegistry:
             tool: Tool instance to register
         """
         self._tools[tool.name] = tool
+        self._cached_openai_tools = None
         logger.debug(f"工具已注册: {tool.name}")
     
     def unregister(self, tool_name: str) -> None:
@@ -34,6 +38,7 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             self._tools.pop(tool_name, None)
+            self._cached_openai_tools = None
             logger.debug(f"工具已注销: {tool_name}")
         else:
             logger.warning(f"尝试注销不存在的工具: {tool_name}")
@@ -63,10 +68,15 @@ class ToolRegistry:
         """
         Get all tools in OpenAI function calling format.
         
+        The definitions are built once and reused until a tool is
+        registered or unregistered.
+        
         Returns:
             List of tool definitions
         """
-        return [tool.to_openai_format() for tool in self._tools.values()]
+        if self._cached_openai_tools is None:
+            self._cached_openai_tools = [tool.to_openai_format() for tool in self._tools.values()]
+        return self._cached_openai_tools
     
     async def execute_tool(self, tool_name: str, arguments_str: str) -> str:
         """
@@ -109,6 +119,35 @@ class ToolRegistry:
             logger.error(f"工具 {tool_name} 执行失败: {e}", exc_info=True)
             return error_msg
     
+    async def execute_tools(self, calls: List[Tuple[str, str]]) -> List[str]:
+        """
+        Execute a batch of independent tool calls concurrently.
+        
+        Only use this for calls that are safe to interleave, see is_read_only.
+        
+        Args:
+            calls: List of (tool_name, arguments_str) pairs
+            
+        Returns:
+            Tool execution results, in the same order as calls
+        """
+        return list(await asyncio.gather(
+            *(self.execute_tool(tool_name, arguments_str) for tool_name, arguments_str in calls)
+        ))
+    
+    def is_read_only(self, tool_name: str) -> bool:
+        """
+        Check whether a tool is read-only and safe to run concurrently.
+        
+        Args:
+            tool_name: Name of tool to check
+            
+        Returns:
+            True if the tool exists and is marked read-only
+        """
+        tool = self._tools.get(tool_name)
+        return tool is not None and tool.read_only
+    
     def tool_exists(self, tool_name: str) -> bool:
         """
         Check if a tool exists.
@@ -124,4 +163,5 @@ class ToolRegistry:
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
+        self._cached_openai_tools = None
 
@@ -1,41 +1,79 @@
 """Time and date tool."""
 
-from typing import Dict, Any
+import re
+import time
+from typing import Dict, Any, Tuple
 from datetime import datetime, timedelta
 import datetime as dt
 from .base import BaseTool
 
 
+# 时区偏移格式：可选正负号 + 0~23 小时
+_TZ_RE = re.compile(r'([+-]?)(0?\d|1\d|2[0-3])')
+
+# 时区缓存：原始时区字符串 -> (timezone 对象, "UTC+8" 形式的显示字符串)
+_TZ_CACHE: Dict[str, Tuple[dt.timezone, str]] = {}
+
+# 按整数偏移缓存，不同写法（如 '8' 和 '+8'）共享同一个 timezone 对象
+_OFFSET_CACHE: Dict[int, Tuple[dt.timezone, str]] = {}
+
+
+def _cache_timezone(timezone: str, offset_hours: int) -> Tuple[dt.timezone, str]:
+    """
+    Build and cache the timezone entry for an offset.
+    
+    Args:
+        timezone: Raw timezone string as passed to the tool
+        offset_hours: Parsed offset in hours
+        
+    Returns:
+        Tuple of (timezone object, display string)
+    """
+    entry = _OFFSET_CACHE.get(offset_hours)
+    if entry is None:
+        sign = '-' if offset_hours < 0 else '+'
+        entry = (
+            dt.timezone(timedelta(hours=offset_hours)),
+            f"UTC{sign}{abs(offset_hours)}"
+        )
+        _OFFSET_CACHE[offset_hours] = entry
+    _TZ_CACHE[timezone] = entry
+    return entry
+
+
+# 预先缓存常用时区
+for _offset in (0, 1, 2, 3, 5, 8, 9, 10, -3, -5, -6, -7, -8):
+    _cache_timezone(f"{_offset:+d}", _offset)
+_TZ_CACHE[""] = _TZ_CACHE["8"] = _TZ_CACHE["+8"]
+del _offset
+
+
 class TimeTool(BaseTool):
     """Tool for getting current time and date information."""
     
-    @property
-    def name(self) -> str:
-        return "get_current_time"
+    read_only = True
     
-    @property
-    def description(self) -> str:
-        return "Get current date and time information. Can return time in different timezones and formats."
+    name = "get_current_time"
     
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "timezone": {
-                    "type": "string",
-                    "description": "Timezone offset in hours, e.g. '+8' for Beijing, '+0' for UTC, '-5' for New York EST",
-                    "default": "+8"
-                },
-                "output_format": {
-                    "type": "string",
-                    "description": "Output format: 'full' (详细), 'date' (仅日期), 'time' (仅时间), 'timestamp' (时间戳)",
-                    "enum": ["full", "date", "time", "timestamp"],
-                    "default": "full"
-                }
+    description = "Get current date and time information. Can return time in different timezones and formats."
+    
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "timezone": {
+                "type": "string",
+                "description": "Timezone offset in hours, e.g. '+8' for Beijing, '+0' for UTC, '-5' for New York EST",
+                "default": "+8"
             },
-            "required": []
-        }
+            "output_format": {
+                "type": "string",
+                "description": "Output format: 'full' (详细), 'date' (仅日期), 'time' (仅时间), 'timestamp' (时间戳)",
+                "enum": ["full", "date", "time", "timestamp"],
+                "default": "full"
+            }
+        },
+        "required": []
+    }
     
     async def execute(self, timezone: str = "+8", output_format: str = "full", **kwargs) -> str:
         """
@@ -49,21 +87,31 @@ class TimeTool(BaseTool):
         Returns:
             Time information as string
         """
+        # 时间戳与时区无关，直接返回
+        if output_format == "timestamp":
+            return f"当前时间戳: {int(time.time())}"
+        
+        # 模型可能传入数字或带空格的字符串，统一规范化
+        timezone = str(timezone).strip()
+        
+        # 解析时区偏移（优先命中缓存，未命中时才做正则校验）
+        entry = _TZ_CACHE.get(timezone)
+        if entry is None:
+            m = _TZ_RE.fullmatch(timezone)
+            if not m:
+                return f"错误：无效的时区偏移 '{timezone}'。请使用格式如 '+8', '-5' 等"
+            offset_hours = int(m.group(2))
+            if m.group(1) == '-':
+                offset_hours = -offset_hours
+            entry = _cache_timezone(timezone, offset_hours)
+        tz, tz_str = entry
+        
         try:
-            # 解析时区偏移
-            if timezone.startswith('+') or timezone.startswith('-'):
-                offset_hours = int(timezone)
-            else:
-                offset_hours = int(timezone) if timezone else 8
-            
-            # 获取当前 UTC 时间并应用时区偏移
-            utc_now = datetime.now(tz=dt.timezone.utc)
-            local_time = utc_now + timedelta(hours=offset_hours)
+            # 获取指定时区的当前时间
+            local_time = datetime.now(tz=tz)
             
             # 根据格式返回结果
-            if output_format == "timestamp":
-                return f"当前时间戳: {int(local_time.timestamp())}"
-            elif output_format == "date":
+            if output_format == "date":
                 weekdays = ["一", "二", "三", "四", "五", "六", "日"]
                 weekday = weekdays[local_time.weekday()]
                 return local_time.strftime(f"%Y年%m月%d日 星期{weekday}")
@@ -74,10 +122,7 @@ class TimeTool(BaseTool):
                 weekday = weekdays[local_time.weekday()]
                 date_str = local_time.strftime(f"%Y年%m月%d日 星期{weekday}")
                 time_str = local_time.strftime("%H:%M:%S")
-                tz_str = f"UTC{timezone}" if timezone.startswith(('+', '-')) else f"UTC+{timezone}"
                 return f"{date_str} {time_str} ({tz_str})"
                 
-        except ValueError:
-            return f"错误：无效的时区偏移 '{timezone}'。请使用格式如 '+8', '-5' 等"
         except Exception as e:
             return f"错误：获取时间失败 - {str(e)}"
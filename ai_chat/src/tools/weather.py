@@ -7,6 +7,8 @@ from .base import BaseTool
 class WeatherTool(BaseTool):
     """Tool for querying weather information (mock data)."""
     
+    read_only = True
+    
     # 模拟天气数据
     WEATHER_DATA = {
         "beijing": {"temp": "11", "condition": "晴天", "humidity": "30%", "wind": "西南风3级"},
@@ -21,6 +23,37 @@ class WeatherTool(BaseTool):
         "chongqing": {"temp": "14", "condition": "阴天", "humidity": "70%", "wind": "东北风2级"},
     }
     
+    # 中文城市名映射
+    CHINESE_CITY_MAP = {
+        "北京": "beijing",
+        "上海": "shanghai",
+        "杭州": "hangzhou",
+        "深圳": "shenzhen",
+        "成都": "chengdu",
+        "广州": "guangzhou",
+        "南京": "nanjing",
+        "武汉": "wuhan",
+        "西安": "xian",
+        "重庆": "chongqing",
+    }
+    
+    # 城市名 -> 查询键（中文名及规范英文名均可直接命中）
+    LOCATION_KEYS = {**{key: key for key in WEATHER_DATA}, **CHINESE_CITY_MAP}
+    
+    # 支持的城市列表（预先拼接）
+    SUPPORTED_CITIES = "、".join(f"{cn}({en})" for cn, en in CHINESE_CITY_MAP.items())
+    
+    # 预先格式化的天气报告正文
+    WEATHER_REPORTS = {
+        key: (
+            f"天气状况: {data['condition']}\n"
+            f"当前温度: {data['temp']}℃\n"
+            f"相对湿度: {data['humidity']}\n"
+            f"风力风向: {data['wind']}"
+        )
+        for key, data in WEATHER_DATA.items()
+    }
+    
     @property
     def name(self) -> str:
         return "get_weather"
@@ -56,18 +89,11 @@ class WeatherTool(BaseTool):
         # 转换为小写英文进行查找
         location_key = self._normalize_location(location)
         
-        if location_key in self.WEATHER_DATA:
-            data = self.WEATHER_DATA[location_key]
-            return (
-                f"{location}天气：\n"
-                f"天气状况: {data['condition']}\n"
-                f"当前温度: {data['temp']}℃\n"
-                f"相对湿度: {data['humidity']}\n"
-                f"风力风向: {data['wind']}"
-            )
+        report = self.WEATHER_REPORTS.get(location_key)
+        if report is not None:
+            return f"{location}天气：\n{report}"
         else:
-            supported_cities = "北京(beijing)、上海(shanghai)、杭州(hangzhou)、深圳(shenzhen)、成都(chengdu)、广州(guangzhou)、南京(nanjing)、武汉(wuhan)、西安(xian)、重庆(chongqing)"
-            return f"抱歉，没有 {location} 的天气数据。\n支持的城市：{supported_cities}"
+            return f"抱歉，没有 {location} 的天气数据。\n支持的城市：{self.SUPPORTED_CITIES}"
     
     def _normalize_location(self, location: str) -> str:
         """
@@ -79,23 +105,10 @@ class WeatherTool(BaseTool):
         Returns:
             Normalized key for lookup
         """
-        # 中文城市名映射
-        chinese_map = {
-            "北京": "beijing",
-            "上海": "shanghai",
-            "杭州": "hangzhou",
-            "深圳": "shenzhen",
-            "成都": "chengdu",
-            "广州": "guangzhou",
-            "南京": "nanjing",
-            "武汉": "wuhan",
-            "西安": "xian",
-            "重庆": "chongqing",
-        }
-        
-        # 如果是中文，转换为英文
-        if location in chinese_map:
-            return chinese_map[location]
+        # 中文名或已规范的英文名直接命中
+        location_key = self.LOCATION_KEYS.get(location)
+        if location_key is not None:
+            return location_key
         
-        # 如果是英文，转换为小写
+        # 其他英文写法转换为小写
         return location.lower().strip()
@@ -2,6 +2,7 @@
 
 import aiohttp
 import asyncio
+import codecs
 from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -18,9 +19,126 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# 浏览器请求头
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+# 网页正文最大读取字节数，超出部分直接丢弃
+MAX_HTML_BYTES = 2 * 1024 * 1024
+
+
+def validate_url(url: str) -> Optional[str]:
+    """
+    Check that a URL uses http or https.
+    
+    Args:
+        url: URL to check
+        
+    Returns:
+        Error message, or None if the URL is valid
+    """
+    if not url.startswith(('http://', 'https://')):
+        return f"错误：URL 必须以 http:// 或 https:// 开头。当前URL: {url}"
+    return None
+
+
+async def read_html(response: aiohttp.ClientResponse, max_bytes: int = MAX_HTML_BYTES) -> str:
+    """
+    Read a response body as text, capped at max_bytes.
+    
+    Args:
+        response: aiohttp response
+        max_bytes: Maximum number of bytes to read
+        
+    Returns:
+        Decoded page content
+    """
+    chunks = []
+    size = 0
+    while size < max_bytes:
+        chunk = await response.content.read(max_bytes - size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    raw = b"".join(chunks)
+    
+    # 读满上限时正文可能被截断，末尾不完整的多字节字符直接丢弃
+    return decode_html(raw, response.charset, truncated=size >= max_bytes)
+
+
+def decode_html(raw: bytes, charset: Optional[str] = None, truncated: bool = False) -> str:
+    """
+    Decode page bytes with the declared charset, falling back to UTF-8 and GBK.
+    
+    Args:
+        raw: Page bytes
+        charset: Charset declared in the Content-Type header
+        truncated: Whether raw may end in the middle of a character
+        
+    Returns:
+        Decoded page content
+    """
+    encodings = []
+    if charset:
+        try:
+            # 未知或非文本编码（如 base64）会抛出 LookupError，直接跳过
+            b"\0".decode(charset, errors='ignore')
+            encodings.append(codecs.lookup(charset).name)
+        except (LookupError, UnicodeError):
+            logger.debug(f"未知的网页编码: {charset}")
+    if 'utf-8' not in encodings:
+        encodings.append('utf-8')
+    
+    for encoding in encodings:
+        try:
+            return codecs.getincrementaldecoder(encoding)().decode(raw, final=not truncated)
+        except UnicodeDecodeError:
+            continue
+    return codecs.getincrementaldecoder('gbk')(errors='ignore').decode(raw, final=not truncated)
+
+
+def clean_text(text: str) -> str:
+    """
+    Strip whitespace and drop empty lines from extracted page text.
+    
+    Args:
+        text: Raw extracted text
+        
+    Returns:
+        Cleaned text
+    """
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
+
+
+def truncate_text(text: str, max_length: int) -> str:
+    """
+    Truncate text to max_length characters with a marker.
+    
+    Args:
+        text: Text to truncate
+        max_length: Maximum length in characters
+        
+    Returns:
+        Original or truncated text
+    """
+    if len(text) > max_length:
+        return text[:max_length] + f"\n\n... (内容已截断，总长度: {len(text)} 字符)"
+    return text
+
+
 class WebScraperTool(BaseTool):
     """Tool for reading and extracting content from websites."""
     
+    read_only = True
+    
     @property
     def name(self) -> str:
         return "read_website"
@@ -92,8 +210,9 @@ class WebScraperTool(BaseTool):
             Extracted text content from the website
         """
         # Validate URL
-        if not url.startswith(('http://', 'https://')):
-            return f"错误：URL 必须以 http:// 或 https:// 开头。当前URL: {url}"
+        url_error = validate_url(url)
+        if url_error:
+            return url_error
         
         # Use browser mode if requested
         if use_browser:
@@ -122,25 +241,15 @@ class WebScraperTool(BaseTool):
                     elif response.status != 200:
                         return f"错误：HTTP {response.status} - 无法访问网站"
                     
-                    # Get content with encoding handling
-                    try:
-                        html = await response.text()
-                    except UnicodeDecodeError:
-                        raw = await response.read()
-                        html = raw.decode('gbk', errors='ignore')
+                    # Get content with encoding handling and size limit
+                    html = await read_html(response)
                     
                     # Parse HTML and extract text
                     soup = BeautifulSoup(html, 'html.parser')
                     text = self._extract_reader_mode(soup) if mode == "reader" else self._extract_standard_mode(soup)
                     
-                    # Clean up text
-                    lines = (line.strip() for line in text.splitlines())
-                    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                    text = '\n'.join(chunk for chunk in chunks if chunk)
-                    
-                    # Limit length
-                    if len(text) > max_length:
-                        text = text[:max_length] + f"\n\n... (内容已截断，总长度: {len(text)} 字符)"
+                    # Clean up and limit length
+                    text = truncate_text(clean_text(text), max_length)
                     
                     # Build result
                     result = f"✓ 网站内容读取成功\n"
@@ -214,14 +323,8 @@ class WebScraperTool(BaseTool):
             soup = BeautifulSoup(html, 'html.parser')
             text = self._extract_reader_mode(soup) if mode == "reader" else self._extract_standard_mode(soup)
             
-            # 清理文本
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
-            
-            # 限制长度
-            if len(text) > max_length:
-                text = text[:max_length] + f"\n\n... (内容已截断，总长度: {len(text)} 字符)"
+            # 清理文本并限制长度
+            text = truncate_text(clean_text(text), max_length)
             
             # 构建结果
             result = f"✓ 网站内容读取成功 (Selenium 浏览器模式)\n"
@@ -245,13 +348,7 @@ class WebScraperTool(BaseTool):
     
     def _get_headers(self) -> Dict[str, str]:
         """获取浏览器请求头"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        }
+        return dict(BROWSER_HEADERS)
     
 
     
@@ -264,12 +361,7 @@ class WebScraperTool(BaseTool):
         # Get text
         text = soup.get_text()
         
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        return text
+        return clean_text(text)
     
 
     
@@ -306,11 +398,6 @@ class WebScraperTool(BaseTool):
             element.decompose()
         
         # 提取并清理文本
-        text = main_content.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        return text
+        return clean_text(main_content.get_text())
     
 
@@ -0,0 +1,57 @@
+"""Tests for the calculator tool."""
+
+import pytest
+
+from ai_chat.tools.calculator import CalculatorTool, _evaluate
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("2 + 3 * 4", 14),
+    ("(10 + 5) / 3", 5.0),
+    ("-2 ** 8", -256),
+    ("7 // 2", 3),
+    ("2 ** 1000", 2 ** 1000),
+])
+def test_evaluate_arithmetic(expression, expected):
+    assert _evaluate(expression) == expected
+
+
+@pytest.mark.parametrize("expression", [
+    "x",
+    "abs(1)",
+    "()",
+    "(1, 2)",
+    "'a'",
+    "True",
+    "1 if 1 else 2",
+])
+def test_evaluate_rejects_unsupported_nodes(expression):
+    with pytest.raises(SyntaxError):
+        _evaluate(expression)
+
+
+@pytest.mark.parametrize("expression", [
+    "9 ** 9 ** 9",
+    "2 ** 1001",
+    "2 ** -1001",
+    "999999 ** 999",
+    "(2 ** 1000) ** 1000",
+])
+def test_evaluate_rejects_oversized_powers(expression):
+    with pytest.raises(ValueError):
+        _evaluate(expression)
+
+
+@pytest.mark.asyncio
+async def test_execute_formats_results():
+    tool = CalculatorTool()
+    assert await tool.execute("2 + 3 * 4") == "2 + 3 * 4 = 14"
+    assert await tool.execute("10 / 4") == "10 / 4 = 2.5"
+    assert await tool.execute("1 / 0") == "错误：除数不能为零"
+
+
+@pytest.mark.asyncio
+async def test_execute_reports_rejected_expressions():
+    tool = CalculatorTool()
+    assert (await tool.execute("()")).startswith("错误：无效的数学表达式")
+    assert (await tool.execute("9 ** 9 ** 9")).startswith("错误：计算失败")
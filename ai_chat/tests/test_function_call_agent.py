@@ -0,0 +1,116 @@
+"""Tests for tool execution in the function call agent."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from ai_chat.agents.function_call_agent import FunctionCallAgent
+from ai_chat.chat.session import SessionManager
+from ai_chat.tools.base import BaseTool
+from ai_chat.tools.registry import ToolRegistry
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        self.sent.append(data)
+
+
+class RecordingTool(BaseTool):
+    """Tool that records when each call starts and finishes."""
+
+    name = ""
+    description = ""
+    parameters = {"type": "object", "properties": {}, "required": []}
+
+    def __init__(self, name: str, read_only: bool, events: List[str], on_finish=None):
+        self.name = name
+        self.description = name
+        self.read_only = read_only
+        self._events = events
+        self._on_finish = on_finish
+
+    async def execute(self, **kwargs) -> str:
+        self._events.append(f"start:{self.name}")
+        await asyncio.sleep(0.01)
+        self._events.append(f"end:{self.name}")
+        if self._on_finish:
+            self._on_finish()
+        return f"{self.name} done"
+
+
+def _tool_call(index: int, name: str) -> Dict[str, Any]:
+    return {"id": f"call_{index}", "function": {"name": name, "arguments": "{}"}}
+
+
+def _make_agent(*tools: BaseTool):
+    registry = ToolRegistry()
+    for tool in tools:
+        registry.register(tool)
+    session_manager = SessionManager()
+    agent = FunctionCallAgent(
+        name="test",
+        llm_client=None,
+        tool_registry=registry,
+        session_manager=session_manager,
+    )
+    return agent, session_manager
+
+
+@pytest.mark.asyncio
+async def test_read_only_tools_run_concurrently():
+    events: List[str] = []
+    agent, _ = _make_agent(
+        RecordingTool("read_a", True, events),
+        RecordingTool("read_b", True, events),
+    )
+    messages: List[Dict[str, Any]] = []
+
+    await agent._execute_tools(
+        FakeWebSocket(), "s1", messages, [_tool_call(0, "read_a"), _tool_call(1, "read_b")]
+    )
+
+    assert events[:2] == ["start:read_a", "start:read_b"]
+    assert [m["tool_call_id"] for m in messages] == ["call_0", "call_1"]
+
+
+@pytest.mark.asyncio
+async def test_side_effecting_turn_runs_sequentially():
+    events: List[str] = []
+    agent, _ = _make_agent(
+        RecordingTool("write", False, events),
+        RecordingTool("read", True, events),
+    )
+    messages: List[Dict[str, Any]] = []
+
+    await agent._execute_tools(
+        FakeWebSocket(), "s1", messages, [_tool_call(0, "write"), _tool_call(1, "read")]
+    )
+
+    assert events == ["start:write", "end:write", "start:read", "end:read"]
+    assert [m["content"] for m in messages] == ["write done", "read done"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_remaining_side_effecting_calls():
+    events: List[str] = []
+    session_manager_ref = {}
+
+    def cancel():
+        session_manager_ref["manager"].set_cancel_flag("s1", True)
+
+    agent, session_manager = _make_agent(
+        RecordingTool("write", False, events, on_finish=cancel),
+        RecordingTool("run", False, events),
+    )
+    session_manager_ref["manager"] = session_manager
+    messages: List[Dict[str, Any]] = []
+
+    await agent._execute_tools(
+        FakeWebSocket(), "s1", messages, [_tool_call(0, "write"), _tool_call(1, "run")]
+    )
+
+    assert events == ["start:write", "end:write"]
@@ -0,0 +1,45 @@
+"""Tests for the LLM client lifecycle."""
+
+import asyncio
+
+from ai_chat.config import LLMConfig
+from ai_chat.llm.client import LLMClient
+
+
+def _make_client() -> LLMClient:
+    return LLMClient(LLMConfig(api_key="test", base_url="http://127.0.0.1:1/v1"))
+
+
+def test_client_is_reused_within_one_loop():
+    llm_client = _make_client()
+
+    async def get_twice():
+        return llm_client.client, llm_client.client
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+
+
+def test_client_is_recreated_for_a_new_loop():
+    llm_client = _make_client()
+
+    async def get_client():
+        return llm_client.client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+    asyncio.run(llm_client.close())
+    assert llm_client._openai_client is None
+
+
+def test_client_initialized_outside_a_loop_binds_on_first_use():
+    llm_client = _make_client()
+    initialized = llm_client.initialize()
+
+    async def get_client():
+        return llm_client.client
+
+    assert asyncio.run(get_client()) is initialized
+    assert asyncio.run(get_client()) is not initialized
@@ -0,0 +1,58 @@
+"""Tests for the planning agent's task manager."""
+
+from ai_chat.agents.planning_agent import Task, TaskManager, TaskPriority, TaskStatus
+
+
+def _ids(tasks):
+    return [task.id for task in tasks]
+
+
+def test_executable_tasks_sorted_by_priority_then_insertion_order():
+    manager = TaskManager()
+    manager.add_task(Task(id="low", title="low", description="", priority=TaskPriority.LOW))
+    manager.add_task(Task(id="medium_1", title="m1", description=""))
+    manager.add_task(Task(id="critical", title="c", description="", priority=TaskPriority.CRITICAL))
+    manager.add_task(Task(id="medium_2", title="m2", description=""))
+
+    assert _ids(manager.get_executable_tasks()) == ["critical", "medium_1", "medium_2", "low"]
+
+
+def test_dependency_chain_unblocks_on_completion():
+    manager = TaskManager()
+    manager.add_task(Task(id="c", title="c", description="", dependencies=["b"]))
+    manager.add_task(Task(id="b", title="b", description="", dependencies=["a"]))
+    manager.add_task(Task(id="a", title="a", description=""))
+
+    steps = []
+    while True:
+        executable = manager.get_executable_tasks()
+        if not executable:
+            break
+        task = executable[0]
+        steps.append(task.id)
+        manager.update_task_status(task.id, TaskStatus.COMPLETED)
+
+    assert steps == ["a", "b", "c"]
+
+
+def test_in_progress_and_failed_tasks_are_not_executable():
+    manager = TaskManager()
+    manager.add_task(Task(id="a", title="a", description=""))
+    manager.add_task(Task(id="b", title="b", description="", dependencies=["a"]))
+
+    manager.update_task_status("a", TaskStatus.IN_PROGRESS)
+    assert manager.get_executable_tasks() == []
+
+    manager.update_task_status("a", TaskStatus.FAILED, error="boom")
+    assert manager.get_executable_tasks() == []
+    assert manager.get_task("a").error == "boom"
+
+    manager.update_task_status("a", TaskStatus.PENDING)
+    assert _ids(manager.get_executable_tasks()) == ["a"]
+
+
+def test_missing_dependency_blocks_task():
+    manager = TaskManager()
+    manager.add_task(Task(id="a", title="a", description="", dependencies=["missing"]))
+
+    assert manager.get_executable_tasks() == []
@@ -0,0 +1,75 @@
+"""Tests for session history trimming."""
+
+from typing import Any, Dict, List
+
+from ai_chat.chat.session import SessionManager
+
+
+def _turn(index: int, with_tools: bool = False) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = [{"role": "user", "content": f"q{index}"}]
+    if with_tools:
+        messages.append({
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"id": f"call_{index}", "function": {"name": "search", "arguments": "{}"}}],
+        })
+        messages.append({"role": "tool", "tool_call_id": f"call_{index}", "content": "result"})
+    messages.append({"role": "assistant", "content": f"a{index}"})
+    return messages
+
+
+def _manager(max_history: int, messages: List[Dict[str, Any]]) -> SessionManager:
+    manager = SessionManager(max_history=max_history)
+    for message in messages:
+        manager.add_message("s1", message)
+    return manager
+
+
+def test_trim_keeps_leading_system_message():
+    system = {"role": "system", "content": "prompt"}
+    manager = _manager(2, [system] + _turn(0) + _turn(1) + _turn(2))
+
+    manager.trim_messages("s1")
+
+    assert manager.get_messages("s1") == [system] + _turn(2)
+
+
+def test_trim_cuts_on_user_message_and_keeps_tool_pairs():
+    # 窗口边界落在第一轮的 tool 消息上
+    manager = _manager(6, _turn(0, with_tools=True) + _turn(1, with_tools=True))
+
+    manager.trim_messages("s1")
+
+    messages = manager.get_messages("s1")
+    assert messages == _turn(1, with_tools=True)
+    assert messages[0]["role"] == "user"
+    tool_call_ids = {
+        call["id"] for message in messages for call in message.get("tool_calls", [])
+    }
+    assert all(
+        message["tool_call_id"] in tool_call_ids
+        for message in messages if message["role"] == "tool"
+    )
+
+
+def test_trim_is_noop_without_later_user_message():
+    messages = _turn(0, with_tools=True)
+    manager = _manager(2, messages)
+
+    manager.trim_messages("s1")
+
+    assert manager.get_messages("s1") == messages
+
+
+def test_trim_is_noop_within_window_or_without_limit():
+    messages = _turn(0) + _turn(1)
+
+    within_window = _manager(4, messages)
+    within_window.trim_messages("s1")
+    assert within_window.get_messages("s1") == messages
+
+    unlimited = SessionManager()
+    for message in messages:
+        unlimited.add_message("s1", message)
+    unlimited.trim_messages("s1")
+    assert unlimited.get_messages("s1") == messages
@@ -0,0 +1,71 @@
+"""Tests for the shared web page fetch helpers."""
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from ai_chat.tools.web_scraper import decode_html, read_html
+
+
+class FakeContent:
+    def __init__(self, body: bytes, chunk_size: int):
+        self._body = body
+        self._chunk_size = chunk_size
+
+    async def read(self, n: int) -> bytes:
+        chunk = self._body[:min(n, self._chunk_size)]
+        self._body = self._body[len(chunk):]
+        return chunk
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, charset: Optional[str] = None, content_type: str = "text/html",
+                 chunk_size: int = 4096):
+        self.headers: Dict[str, str] = {"Content-Type": content_type}
+        self.content_type = content_type
+        self.charset = charset
+        self.content = FakeContent(body, chunk_size)
+
+
+CHINESE_PAGE = "<html><body>" + "中文内容" * 1000 + "</body></html>"
+
+
+@pytest.mark.asyncio
+async def test_read_html_decodes_declared_charset():
+    html = await read_html(FakeResponse(CHINESE_PAGE.encode("gbk"), charset="gbk"))
+    assert html == CHINESE_PAGE
+
+
+@pytest.mark.asyncio
+async def test_read_html_falls_back_on_unknown_charset():
+    html = await read_html(FakeResponse(CHINESE_PAGE.encode("utf-8"), charset="foobar"))
+    assert html == CHINESE_PAGE
+
+
+@pytest.mark.asyncio
+async def test_read_html_falls_back_to_gbk_without_charset():
+    html = await read_html(FakeResponse(CHINESE_PAGE.encode("gbk")))
+    assert html == CHINESE_PAGE
+
+
+@pytest.mark.asyncio
+async def test_read_html_drops_character_cut_by_size_cap():
+    body = CHINESE_PAGE.encode("utf-8")
+    # 上限落在一个三字节汉字中间
+    max_bytes = len("<html><body>".encode("utf-8")) + 3 * 100 + 1
+
+    html = await read_html(FakeResponse(body, chunk_size=64), max_bytes=max_bytes)
+
+    assert html == "<html><body>" + ("中文内容" * 25)
+
+
+@pytest.mark.asyncio
+async def test_read_html_returns_non_html_text():
+    body = '{"name": "测试"}'.encode("utf-8")
+    html = await read_html(FakeResponse(body, content_type="application/json"))
+    assert html == '{"name": "测试"}'
+
+
+@pytest.mark.parametrize("charset", [None, "utf-8", "base64", "idna"])
+def test_decode_html_skips_unusable_charsets(charset):
+    assert decode_html("标题".encode("utf-8"), charset) == "标题"
@@ -1,15 +1,11 @@
 """DeepWiki Agent - 专注于深度知识探索的 Agent."""
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../../ai_chat/backend'))
-
 from typing import Dict, List, Any, Optional
 from fastapi import WebSocket
 
-from agents.function_call_agent import FunctionCallAgent
-from tools.registry import ToolRegistry
-from chat.session import SessionManager
+from ai_chat.agents.function_call_agent import FunctionCallAgent
+from ai_chat.tools.registry import ToolRegistry
+from ai_chat.chat.session import SessionManager
 
 
 class DeepWikiAgent(FunctionCallAgent):
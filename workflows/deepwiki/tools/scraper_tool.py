@@ -1,57 +1,233 @@
 """网页抓取工具 - 用于提取网页内容."""
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../../ai_chat/backend'))
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 
-from typing import Dict, Any
-from tools.base import BaseTool
+import aiohttp
+from bs4 import BeautifulSoup
+
+from ai_chat.tools.base import BaseTool
+from ai_chat.tools.web_scraper import (
+    BROWSER_HEADERS,
+    clean_text,
+    read_html,
+    truncate_text,
+    validate_url,
+)
 
 
 class ScraperTool(BaseTool):
     """网页抓取工具 - 提取网页文本内容."""
     
-    @property
-    def name(self) -> str:
-        return "scrape_webpage"
-    
-    @property
-    def description(self) -> str:
-        return "抓取指定网页的文本内容，用于深度阅读和分析。"
-    
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "要抓取的网页 URL"
-                },
-                "extract_links": {
-                    "type": "boolean",
-                    "description": "是否提取页面中的链接",
-                    "default": False
-                }
+    read_only = True
+    
+    name = "scrape_webpage"
+    
+    description = "抓取指定网页的文本内容，用于深度阅读和分析。"
+    
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "要抓取的网页 URL"
             },
-            "required": ["url"]
-        }
+            "extract_links": {
+                "type": "boolean",
+                "description": "是否提取页面中的链接",
+                "default": False
+            },
+            "max_length": {
+                "type": "integer",
+                "description": "返回正文的最大字符数，超出部分会被截断",
+                "default": 8000,
+                "minimum": 500,
+                "maximum": 32000
+            },
+            "force_rescrape": {
+                "type": "boolean",
+                "description": "是否忽略缓存重新抓取（页面内容可能已更新时使用）",
+                "default": False
+            }
+        },
+        "required": ["url"]
+    }
+    
+    # 请求超时（秒）
+    TIMEOUT = 15
     
-    async def execute(self, url: str, extract_links: bool = False) -> str:
+    # 返回正文长度的允许范围（字符）
+    MIN_LENGTH = 500
+    MAX_LENGTH = 32000
+    
+    # 抓取结果缓存：最大条目数、成功结果有效期、失败结果有效期（秒）
+    CACHE_SIZE = 512
+    CACHE_TTL = 900
+    ERROR_CACHE_TTL = 60
+    
+    def __init__(self):
+        """初始化抓取工具，HTTP 会话在首次抓取时创建."""
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 创建会话时所在的事件循环，会话不能跨事件循环使用
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # (url, extract_links, max_length) -> (过期时间, 抓取结果)，按最近使用排序
+        self._cache: "OrderedDict[Tuple[str, bool, int], Tuple[float, str]]" = OrderedDict()
+    
+    async def execute(
+        self,
+        url: str,
+        extract_links: bool = False,
+        max_length: int = 8000,
+        force_rescrape: bool = False
+    ) -> str:
         """
         抓取网页内容.
         
+        同一 URL 的结果会被缓存，重复抓取直接返回缓存内容。
+        
         Args:
             url: 网页 URL
             extract_links: 是否提取链接
+            max_length: 返回正文的最大字符数，限制在 MIN_LENGTH 到 MAX_LENGTH 之间
+            force_rescrape: 是否忽略缓存重新抓取
             
         Returns:
             网页内容摘要
         """
-        # TODO: 实现真实的网页抓取逻辑（可使用 BeautifulSoup, Playwright 等）
-        result = f"已抓取网页: {url}\n\n内容摘要:\n这是从网页提取的文本内容..."
+        url_error = validate_url(url)
+        if url_error:
+            return url_error
+        
+        # max_length 由模型给出，限制在合理范围内，避免负数或超大值
+        max_length = min(max(int(max_length), self.MIN_LENGTH), self.MAX_LENGTH)
+        
+        key = (url, extract_links, max_length)
+        if not force_rescrape:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return entry[1]
+        
+        result, ok = await self._scrape(url, extract_links, max_length)
         
+        # 失败结果短暂缓存，避免短时间内反复请求同一个不可用的页面
+        ttl = self.CACHE_TTL if ok else self.ERROR_CACHE_TTL
+        self._cache[key] = (time.monotonic() + ttl, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        
+        return result
+    
+    async def _scrape(self, url: str, extract_links: bool, max_length: int) -> Tuple[str, bool]:
+        """
+        请求并解析网页.
+        
+        Args:
+            url: 网页 URL
+            extract_links: 是否提取链接
+            max_length: 返回正文的最大字符数
+            
+        Returns:
+            (抓取结果, 是否成功)
+        """
+        try:
+            async with self._get_session().get(url, allow_redirects=True) as response:
+                if response.status != 200:
+                    return f"错误：HTTP {response.status} - 无法访问网页 {url}", False
+                # 只解析文本类响应，图片、PDF 等二进制内容不下载
+                if 'Content-Type' in response.headers and not self._is_text_type(response.content_type):
+                    return f"错误：不支持的内容类型: {response.content_type} - {url}", False
+                html = await read_html(response)
+        except asyncio.TimeoutError:
+            return f"错误：访问超时 - {url}", False
+        except aiohttp.ClientError as e:
+            return f"错误：网络请求失败 - {str(e)}", False
+        
+        # HTML 解析是同步的 CPU 密集操作，放到线程池执行，避免阻塞事件循环
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self._extract, url, html, extract_links, max_length)
+        return result, True
+    
+    @staticmethod
+    def _is_text_type(mime_type: str) -> bool:
+        """
+        判断 MIME 类型是否为可提取文本的内容.
+        
+        Args:
+            mime_type: 响应的 MIME 类型
+            
+        Returns:
+            是否为 text/*、HTML、XML 或 JSON
+        """
+        return mime_type.startswith('text/') or any(
+            marker in mime_type for marker in ('html', 'xml', 'json')
+        )
+    
+    @staticmethod
+    def _extract(url: str, html: str, extract_links: bool, max_length: int) -> str:
+        """
+        从 HTML 中提取正文文本和链接.
+        
+        Args:
+            url: 网页 URL
+            html: 网页 HTML
+            extract_links: 是否提取链接
+            max_length: 返回正文的最大字符数
+            
+        Returns:
+            格式化的抓取结果
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # 先提取链接，再移除非正文元素
+        links = []
         if extract_links:
-            result += "\n\n找到的链接:\n- https://example.com/link1\n- https://example.com/link2"
+            links = [a['href'] for a in soup.find_all('a', href=True)
+                     if a['href'].startswith(('http://', 'https://'))]
+        
+        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']):
+            element.decompose()
+        
+        # 限制长度，避免整页内容进入后续对话上下文
+        text = truncate_text(clean_text(soup.get_text("\n")), max_length)
+        
+        result = f"已抓取网页: {url}\n\n内容摘要:\n{text}"
+        
+        if extract_links:
+            result += "\n\n找到的链接:\n" + "\n".join(f"- {link}" for link in links)
         
         return result
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取共享的 HTTP 会话.
+        
+        多次抓取复用同一个连接池，保持 keep-alive 连接，
+        避免每次请求重新建立 TCP/TLS 连接。
+        会话绑定在创建它的事件循环上，事件循环变化时重新创建。
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            # 旧事件循环上的连接无法在当前循环中关闭，直接丢弃
+            self._session.detach()
+            self._session = None
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT),
+                headers=BROWSER_HEADERS
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """关闭 HTTP 会话并释放连接."""
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                self._session.detach()
+            self._session = None
+            self._session_loop = None
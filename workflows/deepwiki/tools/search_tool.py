@@ -1,41 +1,33 @@
 """搜索工具 - 用于网络搜索."""
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../../ai_chat/backend'))
-
 from typing import Dict, Any
-from tools.base import BaseTool
+from ai_chat.tools.base import BaseTool
 
 
 class SearchTool(BaseTool):
     """网络搜索工具 - 搜索相关信息."""
     
-    @property
-    def name(self) -> str:
-        return "search"
+    read_only = True
+    
+    name = "search"
     
-    @property
-    def description(self) -> str:
-        return "搜索网络上的相关信息。适用于查找最新资讯、学术论文、技术文档等。"
+    description = "搜索网络上的相关信息。适用于查找最新资讯、学术论文、技术文档等。"
     
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "搜索查询关键词"
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "最大返回结果数量",
-                    "default": 5
-                }
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "搜索查询关键词"
             },
-            "required": ["query"]
-        }
+            "max_results": {
+                "type": "integer",
+                "description": "最大返回结果数量",
+                "default": 5
+            }
+        },
+        "required": ["query"]
+    }
     
     async def execute(self, query: str, max_results: int = 5) -> str:
         """
@@ -1,15 +1,12 @@
 """DeepWiki Workflow - 工作流编排."""
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../ai_chat/backend'))
-
 from typing import Optional
 from fastapi import WebSocket
 
-from tools.registry import ToolRegistry
-from chat.session import SessionManager
-from llm.client import LLMClient
+from ai_chat.config import config
+from ai_chat.tools.registry import ToolRegistry
+from ai_chat.chat.session import SessionManager
+from ai_chat.llm.client import LLMClient
 
 from .agents.deepwiki_agent import DeepWikiAgent
 from .tools.search_tool import SearchTool
@@ -21,31 +18,40 @@ class DeepWikiWorkflow:
     DeepWiki 工作流
     
     负责初始化和编排整个 DeepWiki 应用的组件。
+    未注入的 LLM 客户端和工具注册表在进程内共享，
+    多个工作流实例复用同一个 HTTP 连接池和工具实例。
     """
     
+    # 进程内共享的默认组件，首次使用时创建
+    _shared_llm_client: Optional[LLMClient] = None
+    _shared_tool_registry: Optional[ToolRegistry] = None
+    
     def __init__(
         self,
         llm_client: Optional[LLMClient] = None,
-        session_manager: Optional[SessionManager] = None
+        session_manager: Optional[SessionManager] = None,
+        tool_registry: Optional[ToolRegistry] = None
     ):
         """
         初始化工作流.
         
         Args:
-            llm_client: LLM 客户端（如果为 None，会创建默认客户端）
+            llm_client: LLM 客户端（如果为 None，使用共享的默认客户端）
             session_manager: 会话管理器（如果为 None，会创建新实例）
+            tool_registry: 工具注册表（如果为 None，使用共享的默认注册表）
         """
         # 初始化 LLM 客户端
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or self._get_shared_llm_client()
         
         # 初始化会话管理器
         self.session_manager = session_manager or SessionManager()
         
-        # 初始化工具注册表
-        self.tool_registry = ToolRegistry()
-        
-        # 注册 DeepWiki 专用工具
-        self._register_tools()
+        # 初始化工具注册表并注册 DeepWiki 专用工具
+        if tool_registry is None:
+            self.tool_registry = self._get_shared_tool_registry()
+        else:
+            self.tool_registry = tool_registry
+            self._register_tools(self.tool_registry)
         
         # 初始化 Agent
         self.agent = DeepWikiAgent(
@@ -56,13 +62,28 @@ class DeepWikiWorkflow:
             max_iterations=15
         )
     
-    def _register_tools(self) -> None:
-        """注册工作流所需的工具."""
-        # 注册搜索工具
-        self.tool_registry.register(SearchTool())
-        
-        # 注册网页抓取工具
-        self.tool_registry.register(ScraperTool())
+    @classmethod
+    def _get_shared_llm_client(cls) -> LLMClient:
+        """获取共享的 LLM 客户端."""
+        if cls._shared_llm_client is None:
+            cls._shared_llm_client = LLMClient(config.llm)
+        return cls._shared_llm_client
+    
+    @classmethod
+    def _get_shared_tool_registry(cls) -> ToolRegistry:
+        """获取共享的工具注册表."""
+        if cls._shared_tool_registry is None:
+            registry = ToolRegistry()
+            cls._register_tools(registry)
+            cls._shared_tool_registry = registry
+        return cls._shared_tool_registry
+    
+    @staticmethod
+    def _register_tools(tool_registry: ToolRegistry) -> None:
+        """注册工作流所需的工具（已注册的工具不会重复注册）."""
+        for tool_class in (SearchTool, ScraperTool):
+            if tool_registry.get_tool(tool_class.name) is None:
+                tool_registry.register(tool_class())
         
         # 可以继续注册更多工具...
     
@@ -91,12 +112,38 @@ class DeepWikiWorkflow:
             messages=messages
         )
     
+    async def close(self) -> None:
+        """
+        关闭工作流持有的网络资源.
+        
+        共享的 LLM 客户端和工具注册表被其他工作流实例同时使用，不在这里关闭，
+        进程退出时调用 close_shared 释放。
+        """
+        if self.tool_registry is not self._shared_tool_registry:
+            await self._close_registry(self.tool_registry)
+    
+    @classmethod
+    async def close_shared(cls) -> None:
+        """关闭共享 LLM 客户端和工具注册表持有的网络资源（进程退出时调用）."""
+        if cls._shared_llm_client is not None:
+            await cls._shared_llm_client.close()
+        if cls._shared_tool_registry is not None:
+            await cls._close_registry(cls._shared_tool_registry)
+    
+    @staticmethod
+    async def _close_registry(tool_registry: ToolRegistry) -> None:
+        """关闭注册表中抓取工具的 HTTP 会话."""
+        scraper_tool = tool_registry.get_tool(ScraperTool.name)
+        if scraper_tool is not None:
+            await scraper_tool.close()
+    
     def get_info(self) -> dict:
         """获取工作流信息."""
+        tools = self.tool_registry.get_all_tools()
         return {
             "workflow_name": "DeepWiki",
             "description": "深度知识探索工作流",
             "agent": self.agent.get_info(),
-            "tools": [tool.name for tool in self.tool_registry.get_all_tools()],
-            "tool_count": len(self.tool_registry.get_all_tools())
+            "tools": [tool.name for tool in tools],
+            "tool_count": len(tools)
         }